@@ -20,7 +20,8 @@ __status__      = "Production"
 __doc__         = "This module allows you to run OpenBabel CLI commands in python."
 ##################################################
 
-import os, subprocess, inspect, tempfile, sys, time
+import os, subprocess, inspect, tempfile, sys, time, shutil, json, re, hashlib, itertools, threading, csv
+from concurrent.futures import ThreadPoolExecutor
 # from openbabel import openbabel, pybel
 
 class IOHandler:
@@ -193,115 +194,302 @@ class OpenBabel(IOHandler):
             IOHandler (class): Parent class.
     """
     
+    # Command Set (__CmdSet) contains reorganized commands identifiers
+    __CmdSet = {
+        'Obabel'        : {
+            'AddHydrogen'               : lambda condition      : f'-h' if condition else '',                   # -h 	Add hydrogens (make all hydrogen explicit)
+            'AddProperty'               : lambda name, value    : f'--property {name} {value}',                 # --property <name value> Add or replace a property (for example, in an SD file)
+            'AddProps'                  : lambda props          : f'--add {" ".join(props)}',                   # --add <comma sep list> Add properties (for SDF, CML, etc.) from descriptors in list. Use -L descriptors to see available descriptors.
+            'Center'                    : lambda condition      : f'-c' if condition else '',                   # -c 	Center atomic coordinates at (0,0,0)
+            'ChargeCalcMethod'          : lambda method         : f'--partialcharge {method}',                  # --partialcharge <charge-method> Calculate partial charges by the specified method. List available methods using obabel -L charges.
+            'CombineConformers'         : lambda condition      : f'--readconformers' if condition else '',     # --readconformers Combine adjacent conformers in multi-molecule input into a single molecule
+            'ConvertDative'             : lambda condition      : f'-b' if condition else '',                   # -b 	Convert dative bonds (e.g. [N+]([O-])=O to N(=O)=O)
+            'DeleteHydrogens'           : lambda condition      : f'-d' if condition else '',                   # -d 	Delete hydrogens (make all hydrogen implicit)
+            'Generate2D'                : lambda condition      : f'--gen2d' if condition else '',              # --gen2d 	Generate 2D coordinates
+            'Generate3D'                : lambda mode           : f'--gen3d {mode}' if isinstance(mode, str) else f'--gen3d' if mode else '',  # --gen3d [fastest|fast|med|slow|best] 	Generate 3D coordinates, optionally at a given speed level
+            'InputFile'                 : lambda path           : f'"{path}"',                                  # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
+            'InputFormat'               : lambda in_format      : f'-i {in_format}',                            # -i <format-ID> 	Specifies input format. See Supported File Formats and Options.
+            'JoinAllToOneFile'          : lambda condition      : f'-j' if condition else '',                   # -j, --join 	Join all input molecules into a single output molecule entry
+            'OutputFile'                : lambda path           : f'-O "{path}"',                               # -O    Specifies output file path
+            'OutputFormat'              : lambda out_format     : f'-o {out_format}',                           # -o <format-ID> 	Specifies output format. See Supported File Formats and Options.
+            'pH'                        : lambda ph             : f'-p {ph}',                                   # -p <pH> 	Add hydrogens appropriate for pH (use transforms in phmodel.txt)
+            'RenameMolecule'            : lambda title          : f'--title "{title}"',                         # --title <title> Add or replace molecular title
+            'SaveSeparateConformers'    : lambda condition      : f'--writeconformers' if condition else '',    # --writeconformers Output multiple conformers as separate molecules
+            'SaveSeparateFiles'         : lambda condition      : f'-m' if condition else '',                   # -m 	Produce multiple output files, to allow: Splitting one input file - put each molecule into consecutively numbered output files. Batch conversion - convert each of multiple input files into a specified output format
+            'SearchConformers'          : lambda options        : f'--conformer {options}',                     # --conformer <options> Conformer searching to generate low-energy or diverse conformers. For more information, see Generating conformers for structures.
+            'SeparateFragments'         : lambda condition      : f'--separate' if condition else '',           # --separate 	Separate disconnected fragments into individual molecular records
+            'SkipConversionError'       : lambda condition      : f'-e' if condition else '',                   # -e 	Continue to convert molecules after errors
+            # '' : lambda             : f'-a',                            # -a <options> 	Format-specific input options. Use -H <format-ID> to see options allowed by a particular format, or see the appropriate section in Supported File Formats and Options.
+            # '' : lambda             : f'--addinindex',                  # --addinindex 	Append input index to title (that is, the index before any filtering)
+            # '' : lambda             : f'--addoutindex',                 # --addoutindex 	Append output index to title (that is, the index after any filtering)
+            # '' : lambda             : f'--addtotitle',                  # --addtotitle <text> Append the text after each molecule title
+            # '' : lambda             : f'--append',                      # --append <list> Append properties or descriptor values appropriate for a molecule to its title. For more information, see Append property values to the title.
+            # '' : lambda             : f'-C',                            # -C 	Combine molecules in first file with others having the same name
+            # '' : lambda             : f'--delete',                      # --delete <list> Delete properties in list
+            # '' : lambda             : f'-f',                            # -f <#> 	For multiple entry input, start import with molecule # as the first entry
+            # '' : lambda             : f'--filter',                      # --filter <criteria> Filter based on molecular properties. See Filtering molecules from a multimolecule file for examples and a list of criteria.
+            # '' : lambda             : f'-k',                            # -k 	Translate computational chemistry modeling keywords. See the computational chemistry formats (Computational chemistry formats), for example GAMESS Input (inp, gamin) and Gaussian 98/03 Input (gjf, gjc, gau, com).
+            # '' : lambda             : f'-l',                            # -l <#> 	For multiple entry input, stop import with molecule # as the last entry
+            # '' : lambda             : f'-r',                            # -r 	Remove all but the largest contiguous fragment (strip salts)
+            # '' : lambda             : f'-s',                            # -s <SMARTS> 	Convert only molecules matching the SMARTS pattern specified
+            # '' : lambda             : f'-s',                            # -s <filename.xxx> Convert only molecules with the molecule in the file as a substructure
+            # '' : lambda             : f'--sort',                        # --sort 	Output molecules ordered by the value of a descriptor. See Sorting molecules.
+            # '' : lambda             : f'--unique',                      # --unique, --unique <param> Do not convert duplicate molecules. See Remove duplicate molecules.
+            # '' : lambda             : f'-x',                            # -x <options> 	Format-specific output options. use -H <format-ID> to see options allowed by a particular format, or see the appropriate section in Supported File Formats and Options.
+            # '' : lambda             : f'-v',                            # -v <SMARTS> 	Convert only molecules NOT matching the SMARTS pattern specified
+            # '' : lambda             : f'-z',                            # -z 	Compress the output with gzip (not on Windows)
+        },
+        'Obminimize'    : {
+            'Typical': \
+                lambda InFile, OutFile, OutFormat, AddHydrogen, Algorithm, MinSteps, ForceField: \
+                    f'-n {MinSteps} -ff {ForceField} -{Algorithm} {"-h" if AddHydrogen else ""} -o {OutFormat} "{InFile}" > "{OutFile}"'.strip(),
+
+            'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
+            'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
+            'OutputFormat'              : lambda out_format     : f'-o {out_format}',               # -o <format-ID> 	Specifies output format. See Supported File Formats and Options.
+            'AddHydrogen'               : lambda condition      : f'-h' if condition else '',       # -h 	Add hydrogens (make all hydrogen explicit)
+            'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff Forcefield used for minimization
+            'MinimizationAlgorithm'     : lambda algorithm      : f'-{algorithm.lower()}',
+            'MinimizationSteps'         : lambda n              : f'-n {n}',
+        },
+        'Obconformer'   : {
+            'Typical': \
+                lambda InFile, OutFile, NConfs, MinSteps, ForceField: \
+                    f'{NConfs} {MinSteps} "{InFile}" > "{OutFile}" {ForceField}'.strip(),
+            
+            'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
+            'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
+            'ForceField'                : lambda force_field    : f'{force_field}',
+            'NumberOfConformers'        : lambda num            : f'{num}',
+            'MinimizationSteps'         : lambda n              : f'{n}',
+        },
+        'Obenergy'      : {
+            'Typical': \
+                lambda InFile, OutFile, ForceField, AddHydrogen, Verbose: \
+                    f'{"-h" if AddHydrogen else ""} -ff {ForceField} {"-v" if Verbose else ""} "{InFile}" > "{OutFile}"'.strip(),
+
+            'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
+            'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
+            'AddHydrogen'               : lambda condition      : f'-h' if condition else '',       # -h 	Add hydrogens (make all hydrogen explicit)
+            'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff forcefield    Select the forcefield  
+            'Verbose'                   : lambda condition      : f'-v' if condition else '',       # -v    Verbose: print out all individual energy interactions
+        },
+        'Obgen'         : {
+            'Typical': \
+                lambda InFile, OutFile, ForceField: \
+                    f'-ff {ForceField} "{InFile}" > "{OutFile}"'.strip(),
+            
+            'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
+            'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
+            'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff Forcefield used for minimization
+        },
+    }
+
+    # Executables Names (__ExcNames) contains executable software names, resolved to absolute paths by 'Discover'
+    __ExcNames = {
+        'Obabel'        : 'obabel',
+        'Obminimize'    : 'obminimize',
+        'Obconformer'   : 'obconformer',
+        'Obenergy'      : 'obenergy',
+        'Obgen'         : 'obgen',
+    }
+
+    # Discovery results are cached on disk, set to None to disable disk caching
+    DiscoveryCacheFile = os.path.join(os.path.expanduser('~'), '.cache', 'OBPythonInterface', 'discovery.json')
+
+    # Process-wide discovery results and styled shell prefixes, built once by the first instance
+    __Discovery = None
+    __ShellDisplayPrefix = None
+
+
     def __init__(self) -> None:
         # Prefix messages to be displayed on shell output to indicate
         ## which software is running and writing these messages to stdout
-        prefix_style = lambda Text: self.UsrOut(DisplayText=Text, Colour='Yellow', Print=None)
-        self.ShellDisplayPrefix = {
-            'Shell'     : prefix_style('SHELL >>> '),
-            'OpenBabel' : prefix_style('OpenBabel >>> '),
-        }
-
-        # Executables Paths (__ExcPth) contains executable software paths
+        if bool(OpenBabel.__ShellDisplayPrefix == None):
+            prefix_style = lambda Text: self.UsrOut(DisplayText=Text, Colour='Yellow', Print=None)
+            OpenBabel.__ShellDisplayPrefix = {
+                'Shell'     : prefix_style('SHELL >>> '),
+                'OpenBabel' : prefix_style('OpenBabel >>> '),
+            }
+        self.ShellDisplayPrefix = OpenBabel.__ShellDisplayPrefix
+
+        # Executables, version and capabilities, resolved once per process
+        self.Discovery = self.Discover()
+
+        # Executables Paths (__ExcPth) contains executable software paths (bare names if not found on PATH)
         self.__ExcPth = {
-            'Obabel'        : 'obabel',
-            'Obminimize'    : 'obminimize',
-            'Obconformer'   : 'obconformer',
-            'Obenergy'      : 'obenergy',
-            'Obgen'         : 'obgen',
+            name: (f'"{path}"' if ' ' in path else path) if bool(path != None) else self.__ExcNames[name]
+            for name, path in self.Discovery['Paths'].items()
         }
 
-        # Command Set (__CmdSet) contains reorganized commands identifiers
-        self.__CmdSet = {
-            'Obabel'        : {
-                'AddHydrogen'               : lambda condition      : f'-h' if condition else '',                   # -h 	Add hydrogens (make all hydrogen explicit)
-                'AddProperty'               : lambda name, value    : f'--property {name} {value}',                 # --property <name value> Add or replace a property (for example, in an SD file)
-                'AddProps'                  : lambda props          : f'--add {" ".join(props)}',                   # --add <comma sep list> Add properties (for SDF, CML, etc.) from descriptors in list. Use -L descriptors to see available descriptors.
-                'Center'                    : lambda condition      : f'-c' if condition else '',                   # -c 	Center atomic coordinates at (0,0,0)
-                'ChargeCalcMethod'          : lambda method         : f'--partialcharge {method}',                  # --partialcharge <charge-method> Calculate partial charges by the specified method. List available methods using obabel -L charges.
-                'CombineConformers'         : lambda condition      : f'--readconformers' if condition else '',     # --readconformers Combine adjacent conformers in multi-molecule input into a single molecule
-                'ConvertDative'             : lambda condition      : f'-b' if condition else '',                   # -b 	Convert dative bonds (e.g. [N+]([O-])=O to N(=O)=O)
-                'DeleteHydrogens'           : lambda condition      : f'-d' if condition else '',                   # -d 	Delete hydrogens (make all hydrogen implicit)
-                'Generate2D'                : lambda condition      : f'--gen2d' if condition else '',              # --gen2d 	Generate 2D coordinates
-                'Generate3D'                : lambda condition      : f'--gen3d' if condition else '',              # --gen3d 	Generate 3D coordinates
-                'InputFile'                 : lambda path           : f'"{path}"',                                  # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
-                'InputFormat'               : lambda in_format      : f'-i {in_format}',                            # -i <format-ID> 	Specifies input format. See Supported File Formats and Options.
-                'JoinAllToOneFile'          : lambda condition      : f'-j' if condition else '',                   # -j, --join 	Join all input molecules into a single output molecule entry
-                'OutputFile'                : lambda path           : f'-O "{path}"',                               # -O    Specifies output file path
-                'OutputFormat'              : lambda out_format     : f'-o {out_format}',                           # -o <format-ID> 	Specifies output format. See Supported File Formats and Options.
-                'pH'                        : lambda ph             : f'-p {ph}',                                   # -p <pH> 	Add hydrogens appropriate for pH (use transforms in phmodel.txt)
-                'RenameMolecule'            : lambda title          : f'--title "{title}"',                         # --title <title> Add or replace molecular title
-                'SaveSeparateConformers'    : lambda condition      : f'--writeconformers' if condition else '',    # --writeconformers Output multiple conformers as separate molecules
-                'SaveSeparateFiles'         : lambda condition      : f'-m' if condition else '',                   # -m 	Produce multiple output files, to allow: Splitting one input file - put each molecule into consecutively numbered output files. Batch conversion - convert each of multiple input files into a specified output format
-                'SearchConformers'          : lambda options        : f'--conformer {options}',                     # --conformer <options> Conformer searching to generate low-energy or diverse conformers. For more information, see Generating conformers for structures.
-                'SeparateFragments'         : lambda condition      : f'--separate' if condition else '',           # --separate 	Separate disconnected fragments into individual molecular records
-                'SkipConversionError'       : lambda condition      : f'-e' if condition else '',                   # -e 	Continue to convert molecules after errors
-                # '' : lambda             : f'-a',                            # -a <options> 	Format-specific input options. Use -H <format-ID> to see options allowed by a particular format, or see the appropriate section in Supported File Formats and Options.
-                # '' : lambda             : f'--addinindex',                  # --addinindex 	Append input index to title (that is, the index before any filtering)
-                # '' : lambda             : f'--addoutindex',                 # --addoutindex 	Append output index to title (that is, the index after any filtering)
-                # '' : lambda             : f'--addtotitle',                  # --addtotitle <text> Append the text after each molecule title
-                # '' : lambda             : f'--append',                      # --append <list> Append properties or descriptor values appropriate for a molecule to its title. For more information, see Append property values to the title.
-                # '' : lambda             : f'-C',                            # -C 	Combine molecules in first file with others having the same name
-                # '' : lambda             : f'--delete',                      # --delete <list> Delete properties in list
-                # '' : lambda             : f'-f',                            # -f <#> 	For multiple entry input, start import with molecule # as the first entry
-                # '' : lambda             : f'--filter',                      # --filter <criteria> Filter based on molecular properties. See Filtering molecules from a multimolecule file for examples and a list of criteria.
-                # '' : lambda             : f'-k',                            # -k 	Translate computational chemistry modeling keywords. See the computational chemistry formats (Computational chemistry formats), for example GAMESS Input (inp, gamin) and Gaussian 98/03 Input (gjf, gjc, gau, com).
-                # '' : lambda             : f'-l',                            # -l <#> 	For multiple entry input, stop import with molecule # as the last entry
-                # '' : lambda             : f'-r',                            # -r 	Remove all but the largest contiguous fragment (strip salts)
-                # '' : lambda             : f'-s',                            # -s <SMARTS> 	Convert only molecules matching the SMARTS pattern specified
-                # '' : lambda             : f'-s',                            # -s <filename.xxx> Convert only molecules with the molecule in the file as a substructure
-                # '' : lambda             : f'--sort',                        # --sort 	Output molecules ordered by the value of a descriptor. See Sorting molecules.
-                # '' : lambda             : f'--unique',                      # --unique, --unique <param> Do not convert duplicate molecules. See Remove duplicate molecules.
-                # '' : lambda             : f'-x',                            # -x <options> 	Format-specific output options. use -H <format-ID> to see options allowed by a particular format, or see the appropriate section in Supported File Formats and Options.
-                # '' : lambda             : f'-v',                            # -v <SMARTS> 	Convert only molecules NOT matching the SMARTS pattern specified
-                # '' : lambda             : f'-z',                            # -z 	Compress the output with gzip (not on Windows)
-            },
-            'Obminimize'    : {
-                'Typical': \
-                    lambda InFile, OutFile, OutFormat, AddHydrogen, Algorithm, MinSteps, ForceField: \
-                        f'-n {MinSteps} -ff {ForceField} -{Algorithm} {"-h" if AddHydrogen else ""} -o {OutFormat} "{InFile}" > "{OutFile}"'.strip(),
-
-                'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
-                'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
-                'OutputFormat'              : lambda out_format     : f'-o {out_format}',               # -o <format-ID> 	Specifies output format. See Supported File Formats and Options.
-                'AddHydrogen'               : lambda condition      : f'-h' if condition else '',       # -h 	Add hydrogens (make all hydrogen explicit)
-                'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff Forcefield used for minimization
-                'MinimizationAlgorithm'     : lambda algorithm      : f'-{algorithm.lower()}',
-                'MinimizationSteps'         : lambda n              : f'-n {n}',
-            },
-            'Obconformer'   : {
-                'Typical': \
-                    lambda InFile, OutFile, NConfs, MinSteps, ForceField: \
-                        f'{NConfs} {MinSteps} "{InFile}" > "{OutFile}" {ForceField}'.strip(),
-                
-                'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
-                'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
-                'ForceField'                : lambda force_field    : f'{force_field}',
-                'NumberOfConformers'        : lambda num            : f'{num}',
-                'MinimizationSteps'         : lambda n              : f'{n}',
-            },
-            'Obenergy'      : {
-                'Typical': \
-                    lambda InFile, OutFile, ForceField, AddHydrogen, Verbose: \
-                        f'{"-h" if AddHydrogen else ""} -ff {ForceField} {"-v" if Verbose else ""} "{InFile}" > "{OutFile}"'.strip(),
-
-                'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
-                'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
-                'AddHydrogen'               : lambda condition      : f'-h' if condition else '',       # -h 	Add hydrogens (make all hydrogen explicit)
-                'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff forcefield    Select the forcefield  
-                'Verbose'                   : lambda condition      : f'-v' if condition else '',       # -v    Verbose: print out all individual energy interactions
-            },
-            'Obgen'         : {
-                'Typical': \
-                    lambda InFile, OutFile, ForceField: \
-                        f'-ff {ForceField} "{InFile}" > "{OutFile}"'.strip(),
-                
-                'InputFile'                 : lambda path           : f'"{path}"',                      # MUST BE KEPT THIS WAY TO ALLOW PASSING INPUT PATH TO 'self.__ExecuteCommand' AS AN ARGUMENT AND VALUE
-                'OutputFile'                : lambda path           : f'> "{path}"',                    # >    Specifies output file path
-                'ForceField'                : lambda force_field    : f'-ff {force_field}',             # -ff Forcefield used for minimization
-            },
+        # 3D generation speed levels accepted by 'obabel --gen3d', from cheapest to most thorough
+        self.Gen3DSpeeds = ('fastest', 'fast', 'med', 'slow', 'best')
+
+        # Rough relative cost of each speed level (a heuristic, not a measurement), used to estimate the time of a uniform run
+        self.Gen3DRelativeCost = {
+            'fastest'   : 1.0,
+            'fast'      : 2.0,
+            'med'       : 5.0,
+            'slow'      : 20.0,
+            'best'      : 60.0,
         }
 
+        # Automatic speed policy: first rule with (heavy atoms <= MaxAtoms) and (rotatable bonds <= MaxRotors) wins
+        self.Gen3DAutoPolicy = [
+            {'MaxAtoms': 12,    'MaxRotors': 0,     'Speed': 'fastest'},
+            {'MaxAtoms': 30,    'MaxRotors': 3,     'Speed': 'fast'},
+            {'MaxAtoms': 50,    'MaxRotors': 7,     'Speed': 'med'},
+            {'MaxAtoms': 80,    'MaxRotors': 12,    'Speed': 'slow'},
+            {'MaxAtoms': None,  'MaxRotors': None,  'Speed': 'best'},
+        ]
+
+    def Discover(self, Refresh: bool = False) -> dict:
+        """
+            ### Resolve OpenBabel executables and probe version and capabilities, once per process.
+            Results are kept in memory for the whole process and cached on disk in 'self.DiscoveryCacheFile'. \
+            The disk cache is reused as long as PATH, BABEL_LIBDIR, BABEL_DATADIR and the resolved executables are unchanged. \
+            If probing fails (e.g. a broken obabel), capabilities are left empty so no argument is rejected, and nothing is written to disk.
+
+            #### Args:
+                - Refresh (bool, optional): Set to True to ignore both caches and probe again. Defaults to False.
+
+            #### Returns:
+                - dict: The dict includes ['Paths', 'Version', 'Formats', 'ForceFields', 'ChargeMethods', 'Probed', 'Stamps', 'Environ']. \
+                    'Paths' maps each interface name to an absolute executable path, or None if not found. \
+                    'Probed' is True only if every obabel probe succeeded.
+        """
+
+        if bool(OpenBabel.__Discovery != None) and not bool(Refresh):
+            return OpenBabel.__Discovery
+
+        # Executables are resolved against the current PATH without starting any process
+        paths = {name: shutil.which(exc_name) for name, exc_name in self.__ExcNames.items()}
+        stamps = {name: os.path.getmtime(path) for name, path in paths.items() if bool(path != None)}
+        # Plugins depend on these variables as well as on the executables
+        environ = {name: os.environ.get(name) for name in ('PATH', 'BABEL_LIBDIR', 'BABEL_DATADIR')}
+
+        # Reusing disk cache if it was built for the same executables
+        cache_file = self.DiscoveryCacheFile
+        if  not bool(Refresh) \
+        and bool(cache_file != None) \
+        and bool(os.path.isfile(cache_file)):
+            try:
+                with open(file=cache_file, mode='r') as in_file:
+                    cached = json.load(in_file)
+            except (OSError, ValueError):
+                cached = {}
+
+            if  bool(cached.get('Environ') == environ) \
+            and bool(cached.get('Paths') == paths) \
+            and bool(cached.get('Stamps') == stamps):
+                OpenBabel.__Discovery = cached
+                return cached
+
+        discovery = dict({
+            'Paths'         : paths,
+            'Version'       : None,
+            'Formats'       : [],
+            'ForceFields'   : [],
+            'ChargeMethods' : [],
+            'Probed'        : False,
+            'Stamps'        : stamps,
+            'Environ'       : environ,
+        })
+
+        # Probing obabel once for its version and supported plugins
+        if bool(paths['Obabel'] != None):
+            probes = {
+                'Version'       : self.__Probe(paths['Obabel'], ['-V']),
+                'Formats'       : self.__Probe(paths['Obabel'], ['-L', 'formats']),
+                'ForceFields'   : self.__Probe(paths['Obabel'], ['-L', 'forcefields']),
+                'ChargeMethods' : self.__Probe(paths['Obabel'], ['-L', 'charges']),
+            }
+            # First word of each plugin listing line is its ID, e.g. "sdf -- MDL MOL format" or "MMFF94    Merck Molecular Force Field."
+            plugin_ids = lambda text: sorted(set(line.split()[0] for line in text.splitlines() if bool(line.strip())))
+            version = re.search(r'Open Babel (\S+)', probes['Version'] or '')
+
+            # A partial or failed probe would reject valid arguments, so capabilities are only kept if all probes succeeded
+            if  bool(all(x != None for x in probes.values())) \
+            and bool(version) \
+            and bool(plugin_ids(probes['Formats'])):
+                discovery['Version'] = version.group(1)
+                discovery['Formats'] = plugin_ids(probes['Formats'])
+                discovery['ForceFields'] = plugin_ids(probes['ForceFields'])
+                discovery['ChargeMethods'] = plugin_ids(probes['ChargeMethods'])
+                discovery['Probed'] = True
+            else:
+                self.UsrOut(DisplayText=f'Could not probe "{paths["Obabel"]}", formats, force fields and charge methods will not be validated!', Status='NTE')
+
+        # Writing disk cache (a read-only location only disables it). Failed probes are not persisted.
+        if  bool(cache_file != None) \
+        and (bool(discovery['Probed']) or bool(paths['Obabel'] == None)):
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(file=cache_file, mode='w') as out_file:
+                    json.dump(discovery, out_file, indent=4)
+            except OSError:
+                pass
+
+        OpenBabel.__Discovery = discovery
+        return discovery
+
+    def __Probe(self, ExcPath: str, Args: list) -> str | None:
+        """
+            ### Run an executable with arguments and return its stdout
+
+            #### Args:
+                - ExcPath (str): Absolute executable path.
+                - Args (list): Arguments.
+
+            #### Returns:
+                - str | None: Decoded stdout, or None if the process could not start or exited with a non-zero code.
+        """
+
+        try:
+            process = subprocess.run([ExcPath] + Args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=60)
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        return process.stdout.decode('UTF-8', 'replace') if bool(process.returncode == 0) else None
+
+    def __ValidateArg(self, Param: str, Value) -> None:
+        """
+            ### Reject format, force field and charge method values not supported by the installed OpenBabel, and unknown gen3d speed levels.
+            Formats, force fields and charge methods are only checked when capabilities could be probed.
+
+            #### Args:
+                - Param (str): Program argument name without 'OB_' prefix.
+                - Value (Any): Program argument value.
+        """
+
+        supported = {
+            'InputFormat'       : self.Discovery['Formats'],
+            'OutputFormat'      : self.Discovery['Formats'],
+            'ForceField'        : self.Discovery['ForceFields'],
+            'ChargeCalcMethod'  : self.Discovery['ChargeMethods'],
+        }.get(Param)
+
+        # 'Generate3D' accepts a bool or one of the gen3d speed levels
+        if  bool(Param == 'Generate3D') \
+        and bool(isinstance(Value, str)) \
+        and bool(Value not in self.Gen3DSpeeds):
+            raise ValueError(f'Invalid value passed to "{Param}" = "{Value}"! Use True or one of: {", ".join(self.Gen3DSpeeds)}.')
+
+        if  bool(supported) \
+        and bool(str(Value).lower() not in [x.lower() for x in supported]):
+            raise ValueError(f'Invalid value passed to "{Param}" = "{Value}"! Supported values are: {", ".join(supported)}.')
+
+    def __RequireExec(self, FuncName: str) -> None:
+        """
+            ### Raise before starting any process if the executable of 'FuncName' was not found on PATH
+
+            #### Args:
+                - FuncName (str): Interface name, e.g. 'Obabel'.
+        """
+
+        if bool(self.Discovery['Paths'][FuncName] == None):
+            raise FileNotFoundError(f'"{self.__ExcNames[FuncName]}" was not found on PATH! Install OpenBabel CLI or add it to PATH.')
+
     def __ExecuteCommand(self,
         Command:        str,
         ExecName:       str     = 'Shell',
@@ -488,6 +676,10 @@ class OpenBabel(IOHandler):
                 elif bool(param == 'Verbose'):
                     val = Verbose
 
+                # Rejecting unsupported formats, force fields and charge methods before any process starts
+                else:
+                    self.__ValidateArg(Param=param, Value=val)
+
                 # Recalling the arguments values from 'self.__CmdSet'
                 arg = self.__CmdSet[func_name][param](val)
                 
@@ -497,6 +689,7 @@ class OpenBabel(IOHandler):
         
         # Execute the command if 'Execute' is enabled
         if bool(Execute):
+            self.__RequireExec(FuncName=func_name)
             cmd_return = self.__ExecuteCommand(Command=command_str.strip(), ExecName='OpenBabel', Verbose=Verbose, ForceVerbose=ForceVerbose, PrintSameLine=PrintSameLine)
         else:
             cmd_return = None
@@ -515,7 +708,7 @@ class OpenBabel(IOHandler):
         OB_InputFormat:         str | None      = None,
         OB_OutputFormat:        str | None      = None,
         OB_Generate2D:          bool | None     = None,
-        OB_Generate3D:          bool | None     = None,
+        OB_Generate3D:          bool | str | None = None,
         OB_AddHydrogen:         bool | None     = None,
         OB_AddProps:            tuple | None    = None,
         OB_Center:              bool | None     = None,
@@ -540,7 +733,8 @@ class OpenBabel(IOHandler):
                 - OB_InputFormat (str | None, optional): Specifies input format, if set to None, then will be auto-detected. Defaults to None.
                 - OB_OutputFormat (str | None, optional): Specifies output format, if set to None, then will be auto-detected. Defaults to None.
                 - OB_Generate2D (bool | None, optional): Generate 2D coordinates. Defaults to None.
-                - OB_Generate3D (bool | None, optional): Generate 3D coordinates, ADDS HYDROGENS BY DEFAULT EVEN IF 'OB_AddHydrogen' == False. Defaults to None.
+                - OB_Generate3D (bool | str | None, optional): Generate 3D coordinates, ADDS HYDROGENS BY DEFAULT EVEN IF 'OB_AddHydrogen' == False. \
+                    Pass a speed level ('fastest', 'fast', 'med', 'slow', 'best') instead of True to choose the quality/cost trade-off. Defaults to None.
                 - OB_AddHydrogen (bool | None, optional): Make all hydrogen explicit. Defaults to None.
                 - OB_AddProps (tuple | None, optional): Add properties (for SDF, CML, etc.) from descriptors in list. Use -L descriptors to see available descriptors. Defaults to None.
                 - OB_Center (bool | None, optional): Center atomic coordinates at (0,0,0). Defaults to None.
@@ -753,3 +947,1035 @@ class OpenBabel(IOHandler):
         func_return['CmdStr'] += ' && ' + conv_return['CmdStr']
 
         return func_return
+
+    def Gen3DSpeedPolicy(self, HeavyAtoms: int, Rotors: int) -> str:
+        """
+            ### Choose a 3D generation speed level from molecule size and flexibility using 'self.Gen3DAutoPolicy'
+
+            #### Args:
+                - HeavyAtoms (int): Number of heavy atoms.
+                - Rotors (int): Number of rotatable bonds.
+
+            #### Returns:
+                - str: Speed level accepted by 'obabel --gen3d'.
+        """
+
+        for rule in self.Gen3DAutoPolicy:
+            if  bool(rule['MaxAtoms'] == None or HeavyAtoms <= rule['MaxAtoms']) \
+            and bool(rule['MaxRotors'] == None or Rotors <= rule['MaxRotors']):
+                return rule['Speed']
+
+        return self.Gen3DSpeeds[-1]
+
+    def Generate3D(self,
+        OB_InputFile:       str,
+        OB_OutputFile:      str,
+        OB_Speed:           str             = 'auto',
+        OB_InputFormat:     str | None      = None,
+        OB_OutputFormat:    str | None      = None,
+        UniformSpeed:       str             = 'med',
+        MeasureUniform:     bool            = False,
+        Execute:            bool            = False,
+        Verbose:            bool            = False,
+        PrintSameLine:      bool            = False
+    ) -> dict:
+        """
+            ### Generate 3D coordinates with a chosen or automatically selected speed level per molecule.
+            In 'auto' mode each molecule is profiled (heavy atoms and rotatable bonds) and routed to the level picked by \
+            'self.Gen3DSpeedPolicy', so small rigid molecules take the cheap path and only large flexible ones pay for thorough searches.
+
+            #### Args:
+                - OB_InputFile (str): Input molecule file path.
+                - OB_OutputFile (str): Output molecule file path.
+                - OB_Speed (str, optional): 'auto' or one of 'self.Gen3DSpeeds'. Defaults to 'auto'.
+                - OB_InputFormat (str | None, optional): Specifies input format, if set to None, then will be auto-detected. Defaults to None.
+                - OB_OutputFormat (str | None, optional): Specifies output format, if set to None, then will be auto-detected. Defaults to None.
+                - UniformSpeed (str, optional): Speed level used as the reference when reporting time saved. Defaults to 'med' (obabel default).
+                - MeasureUniform (bool, optional): Set to True to really run every molecule at 'UniformSpeed' (output discarded) \
+                    and report the measured time saved. This doubles the work, use it on a sample. Defaults to False.
+                - Execute (bool, optional): Set to True to allow for command execution not only command creation as str. \
+                    In 'auto' mode without execution, only normalization and profiling commands are returned. Defaults to False.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                - PrintSameLine (bool, optional): Prints process output on the same line. Defaults to False.
+
+            #### Returns:
+                - dict: The dict includes ['Speeds', 'Failed', 'CmdStr', 'CmdRtrn', 'Elapsed', 'UniformTime', 'TimeSaved', \
+                    'EstimatedUniformTime', 'EstimatedTimeSaved', 'FuncName']. \
+                    'Speeds' lists the speed level of each molecule in 'auto' mode (empty if not executed) or the single fixed level. \
+                    'Failed' lists indices of input molecules missing from the output ('auto' mode only, None otherwise). \
+                    'Elapsed' is the measured 3D generation time (s) per speed level. \
+                    'UniformTime' is the measured time (s) of the 'UniformSpeed' run and 'TimeSaved' is 'UniformTime' minus the total of 'Elapsed', \
+                    both None unless 'MeasureUniform' is set. \
+                    'EstimatedUniformTime' and 'EstimatedTimeSaved' scale 'Elapsed' by 'self.Gen3DRelativeCost', a rough heuristic \
+                    rather than a measurement ('auto' mode only, None otherwise). Timing keys are None if ('Execute' == False).
+        """
+
+        if bool(OB_Speed != 'auto') and bool(OB_Speed not in self.Gen3DSpeeds):
+            raise ValueError(f'Invalid value passed to "OB_Speed" = "{OB_Speed}"! Use "auto" or one of {self.Gen3DSpeeds}.')
+        if bool(UniformSpeed not in self.Gen3DSpeeds):
+            raise ValueError(f'Invalid value passed to "UniformSpeed" = "{UniformSpeed}"! Use one of {self.Gen3DSpeeds}.')
+
+        # Working files live in a temporary directory removed on return
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            # A fixed speed level is a single obabel call
+            if bool(OB_Speed != 'auto'):
+                start_time = time.perf_counter()
+                conv_return = self.Obabel(
+                    OB_InputFile=OB_InputFile,
+                    OB_OutputFile=OB_OutputFile,
+                    OB_InputFormat=OB_InputFormat,
+                    OB_OutputFormat=OB_OutputFormat,
+                    OB_Generate3D=OB_Speed,
+                    Execute=Execute,
+                    Verbose=Verbose,
+                    PrintSameLine=PrintSameLine
+                )
+                elapsed = time.perf_counter() - start_time
+
+                uniform_time = None
+                if  bool(Execute) \
+                and bool(MeasureUniform):
+                    uniform_time = self.__MeasureUniform(InputFile=OB_InputFile, InputFormat=OB_InputFormat, UniformSpeed=UniformSpeed, TmpDir=tmp_dir)
+
+                return dict({
+                    'Speeds'                : [OB_Speed],
+                    'Failed'                : None,
+                    'CmdStr'                : conv_return['CmdStr'],
+                    'CmdRtrn'               : [conv_return['CmdRtrn']],
+                    'Elapsed'               : {OB_Speed: elapsed} if bool(Execute) else None,
+                    'UniformTime'           : uniform_time,
+                    'TimeSaved'             : uniform_time - elapsed if bool(uniform_time != None) else None,
+                    'EstimatedUniformTime'  : None,
+                    'EstimatedTimeSaved'    : None,
+                    'FuncName'              : 'Generate3D',
+                })
+
+            return self.__Generate3DAuto(
+                TmpDir=tmp_dir,
+                InputFile=OB_InputFile,
+                OutputFile=OB_OutputFile,
+                InputFormat=OB_InputFormat,
+                OutputFormat=OB_OutputFormat,
+                UniformSpeed=UniformSpeed,
+                MeasureUniform=MeasureUniform,
+                Execute=Execute,
+                Verbose=Verbose,
+                PrintSameLine=PrintSameLine
+            )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def __MeasureUniform(self, InputFile: str, InputFormat: str | None, UniformSpeed: str, TmpDir: str) -> float | None:
+        """
+            ### Measure the time of generating 3D coordinates for a whole file at a single speed level, output is discarded
+
+            #### Returns:
+                - float | None: Elapsed time (s), or None if the run failed.
+        """
+
+        start_time = time.perf_counter()
+        uniform_return = self.Obabel(
+            OB_InputFile=InputFile,
+            OB_OutputFile=os.path.join(TmpDir, 'uniform_out.sdf'),
+            OB_InputFormat=InputFormat,
+            OB_OutputFormat='sdf',
+            OB_Generate3D=UniformSpeed,
+            Execute=True
+        )
+        uniform_time = time.perf_counter() - start_time
+
+        if bool(uniform_return['CmdRtrn']['ExitCode'] != 0):
+            self.UsrOut(DisplayText=f'Uniform "{UniformSpeed}" run failed, time saved could not be measured!', Status='NTE')
+            return None
+
+        return uniform_time
+
+    def __Generate3DAuto(self,
+        TmpDir:         str,
+        InputFile:      str,
+        OutputFile:     str,
+        InputFormat:    str | None,
+        OutputFormat:   str | None,
+        UniformSpeed:   str,
+        MeasureUniform: bool,
+        Execute:        bool,
+        Verbose:        bool,
+        PrintSameLine:  bool
+    ) -> dict:
+        """
+            ### 'auto' mode of 'Generate3D', all working files are written to 'TmpDir'
+
+            #### Returns:
+                - dict: Same as 'Generate3D'.
+        """
+
+        tmp_in_file = os.path.join(TmpDir, 'input.sdf')
+
+        # Normalizing input to SDF so that molecules can be routed to different speed levels record by record
+        norm_return = self.Obabel(OB_InputFile=InputFile, OB_OutputFile=tmp_in_file, OB_InputFormat=InputFormat, OB_OutputFormat='sdf', Execute=Execute)
+        # Profiling molecules: heavy atoms (hydrogens deleted) and rotatable bonds appended to the title
+        profile_command = f'{self.__ExcPth["Obabel"]} "{tmp_in_file}" -d -otxt --append "atoms rotors"'
+        commands = [norm_return['CmdStr'], profile_command]
+
+        # Without execution molecules cannot be profiled, so no speed level is planned
+        if not bool(Execute):
+            return dict({
+                'Speeds'                : [],
+                'Failed'                : [],
+                'CmdStr'                : ' && '.join(commands),
+                'CmdRtrn'               : [],
+                'Elapsed'               : None,
+                'UniformTime'           : None,
+                'TimeSaved'             : None,
+                'EstimatedUniformTime'  : None,
+                'EstimatedTimeSaved'    : None,
+                'FuncName'              : 'Generate3D',
+            })
+
+        if bool(norm_return['CmdRtrn']['ExitCode'] != 0):
+            raise RuntimeError(f'Reading "{InputFile}" failed with exit code {norm_return["CmdRtrn"]["ExitCode"]}! {norm_return["CmdRtrn"]["OutMsg"].strip()}')
+        records = self.__SplitSDF(tmp_in_file)
+        if not bool(records):
+            raise RuntimeError(f'No molecules could be read from "{InputFile}"!')
+
+        self.__RequireExec(FuncName='Obabel')
+        profile_return = self.__ExecuteCommand(Command=profile_command, ExecName='OpenBabel')
+        if bool(profile_return['ExitCode'] != 0):
+            raise RuntimeError(f'Profiling "{InputFile}" failed with exit code {profile_return["ExitCode"]}! {profile_return["OutMsg"].strip()}')
+        profile = [line.split()[-2:] for line in profile_return['OutMsg'].splitlines()]
+        profile = [(int(x[0]), int(x[1])) for x in profile if bool(len(x) == 2) and x[0].isdigit() and x[1].isdigit()]
+
+        if bool(len(profile) != len(records)):
+            raise RuntimeError(f'Profiling "{InputFile}" returned {len(profile)} result(s) for {len(records)} molecule(s)!')
+
+        speeds = [self.Gen3DSpeedPolicy(HeavyAtoms=atoms, Rotors=rotors) for atoms, rotors in profile]
+
+        # Tagging each record title with its input index, so outputs are matched back even if some molecules fail
+        tag_title = lambda i, record: f'OBPI{i}|' + record
+        records = [tag_title(i, record) for i, record in enumerate(records)]
+
+        # Writing one input file per speed level
+        groups = {speed: [i for i, x in enumerate(speeds) if x == speed] for speed in self.Gen3DSpeeds}
+        groups = {speed: index for speed, index in groups.items() if bool(index)}
+
+        returns, elapsed = [norm_return['CmdRtrn'], profile_return], {}
+        for speed, index in groups.items():
+            group_in_file = os.path.join(TmpDir, f'{speed}_in.sdf')
+            group_out_file = os.path.join(TmpDir, f'{speed}_out.sdf')
+            with open(file=group_in_file, mode='w') as in_file:
+                in_file.writelines(records[i] for i in index)
+
+            if bool(Verbose):
+                self.UsrOut(DisplayText=f'Generating 3D coordinates for {len(index)} molecule(s) at speed "{speed}"', Status='PRC')
+
+            start_time = time.perf_counter()
+            group_return = self.Obabel(
+                OB_InputFile=group_in_file,
+                OB_OutputFile=group_out_file,
+                OB_OutputFormat='sdf',
+                OB_Generate3D=speed,
+                Execute=Execute,
+                Verbose=Verbose,
+                PrintSameLine=PrintSameLine
+            )
+            elapsed[speed] = time.perf_counter() - start_time
+
+            commands.append(group_return['CmdStr'])
+            returns.append(group_return['CmdRtrn'])
+
+        # Merging outputs of all speed levels back into the original molecules order by their title tags
+        generated = {}
+        for speed in groups:
+            for record in self.__SplitSDF(os.path.join(TmpDir, f'{speed}_out.sdf')):
+                tag = re.match(r'OBPI(\d+)\|', record)
+                if bool(tag):
+                    generated[int(tag.group(1))] = record[tag.end():]
+
+        failed = [i for i in range(len(records)) if bool(i not in generated)]
+        if bool(failed):
+            self.UsrOut(DisplayText=f'{len(failed)} molecule(s) failed 3D generation and were left out of the output: {failed}', Status='NTE')
+
+        tmp_out_file = os.path.join(TmpDir, 'output.sdf')
+        with open(file=tmp_out_file, mode='w') as out_file:
+            out_file.writelines(generated[i] for i in sorted(generated))
+
+        # Converting merged SDF to the user defined output format
+        conv_return = self.Obabel(
+            OB_InputFile=tmp_out_file,
+            OB_OutputFile=OutputFile,
+            OB_InputFormat='sdf',
+            OB_OutputFormat=OutputFormat,
+            Execute=Execute,
+            Verbose=Verbose,
+            PrintSameLine=PrintSameLine
+        )
+        commands.append(conv_return['CmdStr'])
+        returns.append(conv_return['CmdRtrn'])
+
+        # Measured baseline: the same normalized molecules at 'UniformSpeed' in a single run
+        total_time = sum(elapsed.values())
+        uniform_time = self.__MeasureUniform(InputFile=tmp_in_file, InputFormat='sdf', UniformSpeed=UniformSpeed, TmpDir=TmpDir) if bool(MeasureUniform) else None
+        time_saved = uniform_time - total_time if bool(uniform_time != None) else None
+
+        # Heuristic baseline: measured time of each level scaled by rough relative costs
+        estimated_uniform_time = sum(elapsed[speed] * self.Gen3DRelativeCost[UniformSpeed] / self.Gen3DRelativeCost[speed] for speed in elapsed)
+        estimated_time_saved = estimated_uniform_time - total_time
+
+        if bool(Verbose):
+            saved_text = f'measured {time_saved:.2f}s' if bool(time_saved != None) else f'estimated {estimated_time_saved:.2f}s'
+            self.UsrOut(DisplayText=f'3D generation took {total_time:.2f}s, {saved_text} saved compared with uniform "{UniformSpeed}"', Status='SCS')
+
+        return dict({
+            'Speeds'                : speeds,
+            'Failed'                : failed,
+            'CmdStr'                : ' && '.join(commands),
+            'CmdRtrn'               : returns,
+            'Elapsed'               : elapsed,
+            'UniformTime'           : uniform_time,
+            'TimeSaved'             : time_saved,
+            'EstimatedUniformTime'  : estimated_uniform_time,
+            'EstimatedTimeSaved'    : estimated_time_saved,
+            'FuncName'              : 'Generate3D',
+        })
+
+    def __SplitSDF(self, FilePath: str) -> list:
+        """
+            ### Split a multi-molecule SDF file into records, each record keeps its '$$$$' terminator
+
+            #### Args:
+                - FilePath (str): SDF file path.
+
+            #### Returns:
+                - list: SDF records as str.
+        """
+
+        if not bool(os.path.isfile(FilePath)):
+            return []
+
+        records, current = [], []
+        with open(file=FilePath, mode='r') as in_file:
+            for line in in_file:
+                current.append(line)
+                if bool(line.startswith('$$$$')):
+                    records.append(''.join(current))
+                    current = []
+
+        # A trailing record without terminator
+        if bool(''.join(current).strip()):
+            records.append(''.join(current).rstrip('\n') + '\n$$$$\n')
+
+        return records
+
+    def SyncDirectory(self,
+        InputDir:           str,
+        OutputDir:          str,
+        Method:             str                 = 'Obabel',
+        OutputExtension:    str                 = 'sdf',
+        Params:             dict | None         = None,
+        Extensions:         tuple | None        = None,
+        IndexFile:          str | None          = None,
+        Workers:            int | None          = None,
+        Verbose:            bool                = False
+    ) -> dict:
+        """
+            ### Incrementally process a directory tree, only re-running inputs that were added or modified since the last sync.
+            A persistent index keeps size, mtime and content hash of each input along with the parameters used. \
+            Files with unchanged size and mtime are skipped without being read, files touched but not edited are skipped after hashing, \
+            and outputs of removed inputs are deleted. Changing 'Method', 'OutputExtension' or 'Params' reprocesses everything.
+
+            #### Args:
+                - InputDir (str): Input directory, scanned recursively (hidden files and directory symlinks are ignored).
+                - OutputDir (str): Output directory, mirrors the tree of 'InputDir' with output names '<input name>.<OutputExtension>'. \
+                    Must differ from 'InputDir'.
+                - Method (str, optional): Interface method to run on each input, one of ['Obabel', 'Obminimize', 'Obconformer', 'Obgen', 'Generate3D']. Defaults to 'Obabel'.
+                - OutputExtension (str, optional): Extension of output files. Defaults to 'sdf'.
+                - Params (dict | None, optional): Extra 'OB_' arguments passed to 'Method', e.g. {'OB_Generate3D': 'fast'}. Defaults to None.
+                - Extensions (tuple | None, optional): Only sync input files with these extensions, e.g. ('sdf', 'smi'). If set to None, then all files are synced. Defaults to None.
+                - IndexFile (str | None, optional): Index file path. If set to None, then '.obsync_index.json' inside 'OutputDir' is used. Defaults to None.
+                - Workers (int | None, optional): Number of files processed in parallel. If set to None, then CPU count is used. Defaults to None.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - dict: The dict includes ['Added', 'Modified', 'Removed', 'Stale', 'Failed', 'Unchanged', 'Elapsed']. \
+                    'Added', 'Modified', 'Removed' and 'Failed' are lists of input paths relative to 'InputDir'. \
+                    'Stale' lists deleted outputs (relative to 'OutputDir') of surviving inputs that a signature change made obsolete. \
+                    'Unchanged' is a count and 'Elapsed' is in seconds.
+        """
+
+        start_time = time.perf_counter()
+
+        if bool(Method not in ('Obabel', 'Obminimize', 'Obconformer', 'Obgen', 'Generate3D')):
+            raise ValueError(f'Invalid value passed to "Method" = "{Method}"! Use one of Obabel, Obminimize, Obconformer, Obgen or Generate3D.')
+
+        # Outputs written next to their inputs would be synced as inputs and removed as stale outputs
+        if bool(os.path.realpath(OutputDir) == os.path.realpath(InputDir)):
+            raise ValueError(f'"OutputDir" must differ from "InputDir" = "{InputDir}"!')
+
+        Params = dict(Params or {})
+        Extensions = tuple(x.lower().lstrip('.') for x in Extensions) if bool(Extensions) else None
+        IndexFile = IndexFile or os.path.join(OutputDir, '.obsync_index.json')
+        # Output names keep the input extension, so 'x.sdf' and 'x.mol' never share an output
+        output_name = lambda rel_path: rel_path + '.' + OutputExtension.lstrip('.')
+        # Parameters signature, any change invalidates all index entries
+        signature = json.dumps({'Method': Method, 'OutputExtension': OutputExtension, 'Params': Params}, sort_keys=True, default=str)
+
+        # Loading previous index
+        try:
+            with open(file=IndexFile, mode='r') as in_file:
+                index = json.load(in_file)
+        except (OSError, ValueError):
+            index = {}
+        same_signature = bool(index.get('Signature') == signature)
+        entries = index.get('Files', {}) if bool(same_signature) else {}
+        old_outputs = {rel_path: entry['Output'] for rel_path, entry in index.get('Files', {}).items()}
+
+        # Scanning inputs, only stat() is needed at this point
+        current = self.__ScanDirectory(InputDir, Extensions)
+
+        # Outputs written inside 'InputDir' must not be picked up as inputs
+        out_rel_dir = os.path.relpath(OutputDir, InputDir).replace('\\', '/')
+        if not bool(out_rel_dir.startswith('..')):
+            current = {k: v for k, v in current.items() if not bool(k.startswith(out_rel_dir + '/'))}
+
+        added, modified, unchanged = [], [], 0
+        for rel_path, (size, mtime) in current.items():
+            entry = entries.get(rel_path)
+
+            if not bool(entry):
+                added.append(rel_path)
+            elif bool(entry['Size'] == size) and bool(entry['MTime'] == mtime):
+                unchanged += 1
+            # Size or mtime changed, the content hash decides (a file vanishing meanwhile is left to processing)
+            elif bool(entry['Size'] == size) and bool(entry['Hash'] == self.__TryHashFile(os.path.join(InputDir, rel_path))):
+                entry['MTime'] = mtime
+                unchanged += 1
+            else:
+                modified.append(rel_path)
+
+        # Outputs to keep: those current inputs will produce, plus those still tracked under the same signature
+        keep = set(output_name(rel_path) for rel_path in current)
+        if bool(same_signature):
+            keep.update(old_outputs[rel_path] for rel_path in old_outputs if bool(rel_path in current))
+
+        # Deleting outputs of removed inputs, and outputs of surviving inputs made obsolete by a signature change
+        removed = [rel_path for rel_path in old_outputs if bool(rel_path not in current)]
+        stale = [old_outputs[rel_path] for rel_path in old_outputs if bool(rel_path in current) and bool(old_outputs[rel_path] not in keep)]
+        for out_rel_path in [old_outputs[rel_path] for rel_path in removed] + stale:
+            out_file = os.path.join(OutputDir, out_rel_path)
+            if  bool(out_rel_path not in keep) \
+            and bool(os.path.isfile(out_file)):
+                os.remove(out_file)
+        for rel_path in removed:
+            entries.pop(rel_path, None)
+
+        if bool(Verbose):
+            self.UsrOut(DisplayText=f'{len(added)} added, {len(modified)} modified, {len(removed)} removed, {len(stale)} stale output(s), {unchanged} unchanged', Status='NTE')
+
+        # Processing added and modified inputs in parallel
+        def process(rel_path: str) -> tuple:
+            in_file = os.path.join(InputDir, rel_path)
+            out_rel_path = output_name(rel_path)
+            out_file = os.path.join(OutputDir, out_rel_path)
+
+            # Any error is confined to this file, so results of the other files still reach the index
+            try:
+                os.makedirs(os.path.dirname(out_file) or '.', exist_ok=True)
+
+                # Hashing before running, with stat taken around the hash: an edit made during processing
+                # then changes mtime and no longer matches the stored hash, so it is picked up next sync
+                stat_before = os.stat(in_file)
+                file_hash = self.__HashFile(in_file)
+                stat_after = os.stat(in_file)
+                if bool((stat_before.st_size, stat_before.st_mtime_ns) != (stat_after.st_size, stat_after.st_mtime_ns)):
+                    return rel_path, None, 'Input changed while being read'
+
+                func_return = getattr(self, Method)(OB_InputFile=in_file, OB_OutputFile=out_file, **Params, Execute=True)
+
+                cmd_returns = func_return['CmdRtrn'] if isinstance(func_return['CmdRtrn'], list) else [func_return['CmdRtrn']]
+                if  bool(all(x['ExitCode'] == 0 for x in cmd_returns if bool(x))) \
+                and bool(os.path.isfile(out_file)) \
+                and bool(os.path.getsize(out_file) > 0):
+                    entry = {'Size': stat_before.st_size, 'MTime': stat_before.st_mtime_ns, 'Hash': file_hash, 'Output': out_rel_path}
+                    return rel_path, entry, None
+            except Exception as err:
+                return rel_path, None, str(err)
+
+            return rel_path, None, 'Command failed or produced no output'
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=Workers or os.cpu_count()) as executor:
+            for rel_path, entry, error in executor.map(process, added + modified):
+                if bool(entry):
+                    entries[rel_path] = entry
+                else:
+                    # Failed inputs are left out of the index, so they are retried on the next sync
+                    entries.pop(rel_path, None)
+                    failed.append(rel_path)
+                    if bool(Verbose):
+                        self.UsrOut(DisplayText=f'"{rel_path}": {error}', Status='ERR')
+
+        # Writing index atomically
+        os.makedirs(os.path.dirname(IndexFile) or '.', exist_ok=True)
+        with open(file=IndexFile + '.tmp', mode='w') as out_file:
+            json.dump({'Signature': signature, 'Files': entries}, out_file)
+        os.replace(IndexFile + '.tmp', IndexFile)
+
+        elapsed = time.perf_counter() - start_time
+        if bool(Verbose):
+            self.UsrOut(DisplayText=f'Directory synced in {elapsed:.2f}s with {len(failed)} failure(s)', Status='SCS' if not bool(failed) else 'NTE')
+
+        return dict({
+            'Added'     : added,
+            'Modified'  : modified,
+            'Removed'   : removed,
+            'Stale'     : stale,
+            'Failed'    : failed,
+            'Unchanged' : unchanged,
+            'Elapsed'   : elapsed,
+        })
+
+    def __ScanDirectory(self, Directory: str, Extensions: tuple | None) -> dict:
+        """
+            ### Recursively list files of a directory with their size and mtime, skipping hidden entries
+
+            #### Args:
+                - Directory (str): Directory path.
+                - Extensions (tuple | None): Lower-case extensions to keep without dot, or None to keep all files.
+
+            #### Returns:
+                - dict: Maps paths relative to 'Directory' (with '/' separators) to (size, mtime_ns).
+        """
+
+        files, pending = {}, ['']
+        while bool(pending):
+            rel_dir = pending.pop()
+            with os.scandir(os.path.join(Directory, rel_dir)) as entries:
+                for entry in entries:
+                    if bool(entry.name.startswith('.')):
+                        continue
+                    rel_path = f'{rel_dir}/{entry.name}' if bool(rel_dir) else entry.name
+                    # Directory symlinks are not followed, a symlink loop would never end the scan
+                    if bool(entry.is_dir(follow_symlinks=False)):
+                        pending.append(rel_path)
+                    elif  bool(entry.is_file()) \
+                    and  (not bool(Extensions) or bool(entry.name.split('.')[-1].lower() in Extensions)):
+                        stat = entry.stat()
+                        files[rel_path] = (stat.st_size, stat.st_mtime_ns)
+
+        return files
+
+    def __TryHashFile(self, FilePath: str) -> str | None:
+        """
+            ### Content hash of a file, or None if it cannot be read
+        """
+
+        try:
+            return self.__HashFile(FilePath)
+        except OSError:
+            return None
+
+    def __HashFile(self, FilePath: str) -> str:
+        """
+            ### Content hash of a file
+
+            #### Args:
+                - FilePath (str): File path.
+
+            #### Returns:
+                - str: SHA-256 hex digest.
+        """
+
+        file_hash = hashlib.sha256()
+        with open(file=FilePath, mode='rb') as in_file:
+            for chunk in iter(lambda: in_file.read(1 << 20), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    def Sweep(self,
+        InputFiles:         list | tuple,
+        Grid:               dict,
+        Method:             str             = 'Obminimize',
+        Params:             dict | None     = None,
+        PrepareParams:      dict | None     = None,
+        EnergyForceField:   str             = 'MMFF94',
+        EarlyStop:          bool            = True,
+        MinSamples:         int             = 3,
+        CostFactor:         float           = 1.5,
+        EnergyTolerance:    float           = 0.0,
+        OutputDir:          str | None      = None,
+        TableFile:          str | None      = None,
+        Workers:            int | None      = None,
+        Verbose:            bool            = False
+    ) -> dict:
+        """
+            ### Run a grid of 'Obminimize' or 'Obconformer' settings over a molecule set in parallel and collect energies and runtimes.
+            Each input is converted once to SDF, split into single molecules and reused by every grid point. \
+            Every grid point is validated before any work starts, and failing runs are recorded in the table. Output energies are evaluated with 'Obenergy' using \
+            'EnergyForceField' so that points with different force fields are comparable.
+            With 'EarlyStop', a point is stopped once another point reaches an energy at least as low \
+            (within 'EnergyTolerance') while being 'CostFactor' times faster on at least 'MinSamples' common molecules.
+
+            #### Args:
+                - InputFiles (list | tuple): Input molecule file paths.
+                - Grid (dict): Maps 'OB_' arguments of 'Method' to lists of values, e.g. {'OB_ForceField': ['MMFF94', 'UFF'], 'OB_MinimizationSteps': [500, 2500]}.
+                - Method (str, optional): 'Obminimize' or 'Obconformer'. Defaults to 'Obminimize'.
+                - Params (dict | None, optional): Fixed 'OB_' arguments of 'Method' shared by all grid points. Defaults to None.
+                - PrepareParams (dict | None, optional): 'OB_' arguments of 'Obabel' used once to prepare each input, e.g. {'OB_AddHydrogen': True}. Defaults to None.
+                - EnergyForceField (str, optional): Force field used to evaluate output energies. Defaults to 'MMFF94'.
+                - EarlyStop (bool, optional): Set to True to stop points dominated by cost. Defaults to True.
+                - MinSamples (int, optional): Minimum number of common molecules before comparing two points. Defaults to 3.
+                - CostFactor (float, optional): Runtime ratio above which a point with no better energy is dominated. Defaults to 1.5.
+                - EnergyTolerance (float, optional): Mean energy margin within which energies are considered equal. Defaults to 0.0.
+                - OutputDir (str | None, optional): Directory for output files. If set to None, then a temporary directory is used. Defaults to None.
+                - TableFile (str | None, optional): If set, then the result table is also written to this CSV file. Defaults to None.
+                - Workers (int | None, optional): Number of runs executed in parallel. If set to None, then CPU count is used. Defaults to None.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - dict: The dict includes ['Table', 'Summary', 'Elapsed']. 'Table' has one row per (grid point, molecule) with the point \
+                    arguments, 'Molecule' (input file), 'Record' (molecule index in that file), 'OutputFile', 'Runtime', 'Energy', 'EnergyUnit', \
+                    'ExitCode' and 'Error'. 'Summary' has one row per point with 'Completed', 'Failed', 'TotalRuntime', 'MeanRuntime', \
+                    'MeanEnergy', 'CommonMolecules', 'CommonMeanRuntime', 'CommonMeanEnergy' and 'Stopped'. 'MeanRuntime' and 'MeanEnergy' \
+                    cover the molecules each point completed, so points stopped early or with failures average different molecules. \
+                    'Common' means cover only the molecules completed by every point with results, and are the ones to compare across rows.
+        """
+
+        start_time = time.perf_counter()
+
+        if bool(Method not in ('Obminimize', 'Obconformer')):
+            raise ValueError(f'Invalid value passed to "Method" = "{Method}"! Use Obminimize or Obconformer.')
+        if not bool(Grid):
+            raise ValueError('"Grid" must contain at least one argument with a list of values!')
+
+        Params = dict(Params or {})
+        InputFiles = list(InputFiles)
+        if not bool(InputFiles):
+            raise ValueError('"InputFiles" must contain at least one molecule file!')
+        OutputDir = OutputDir or tempfile.mkdtemp()
+        prepare_dir = os.path.join(OutputDir, 'prepared')
+        os.makedirs(prepare_dir, exist_ok=True)
+
+        # Expanding grid into points
+        grid_keys = list(Grid.keys())
+        points = [dict(zip(grid_keys, values)) for values in itertools.product(*[Grid[key] for key in grid_keys])]
+
+        # Building (not executing) every point's command up front, so invalid values or missing arguments fail before any work starts
+        check_file = os.path.join(OutputDir, 'check.sdf')
+        for point in points:
+            try:
+                getattr(self, Method)(OB_InputFile=InputFiles[0], OB_OutputFile=check_file, **{**Params, **point}, Execute=False)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f'Invalid grid point {point} for "{Method}"! {err}') from err
+        self.Obenergy(OB_InputFile=InputFiles[0], OB_OutputFile=check_file, OB_ForceField=EnergyForceField, Execute=False)
+
+        # Preparing each input once, all grid points reuse the prepared files.
+        # Multi-molecule inputs are split so that every run covers exactly one molecule.
+        prepared, molecules = [], []
+        for i, in_file in enumerate(InputFiles):
+            prep_file = os.path.join(prepare_dir, f'{i}.sdf')
+            prep_return = self.Obabel(OB_InputFile=in_file, OB_OutputFile=prep_file, OB_OutputFormat='sdf', **dict(PrepareParams or {}), Execute=True)
+            if bool(prep_return['CmdRtrn']['ExitCode'] != 0) or not bool(os.path.isfile(prep_file)):
+                raise RuntimeError(f'Preparing "{in_file}" failed! {prep_return["CmdRtrn"]["OutMsg"].strip()}')
+
+            for k, record in enumerate(self.__SplitSDF(prep_file)):
+                record_file = os.path.join(prepare_dir, f'{i}_{k}.sdf')
+                with open(file=record_file, mode='w') as out_file:
+                    out_file.write(record)
+                prepared.append(record_file)
+                molecules.append((in_file, k))
+
+        # Results per point: {molecule index: (runtime, energy)}, failed runs are only counted
+        results = [dict() for _ in points]
+        failures = [0] * len(points)
+        stopped = [False] * len(points)
+        lock = threading.Lock()
+
+        def dominated(p: int) -> bool:
+            for q in range(len(points)):
+                if bool(q == p) or bool(stopped[q]):
+                    continue
+                common = [m for m in results[p] if bool(m in results[q])]
+                common = [m for m in common if bool(results[p][m][1] != None) and bool(results[q][m][1] != None)]
+                if bool(len(common) < MinSamples):
+                    continue
+                p_time, q_time = sum(results[p][m][0] for m in common), sum(results[q][m][0] for m in common)
+                p_energy, q_energy = sum(results[p][m][1] for m in common), sum(results[q][m][1] for m in common)
+                if  bool(q_energy / len(common) <= p_energy / len(common) + EnergyTolerance) \
+                and bool(q_time * CostFactor <= p_time):
+                    return True
+            return False
+
+        def run(job: tuple) -> dict | None:
+            p, m = job
+            # Skipping runs of points stopped while this run was queued
+            if bool(stopped[p]):
+                return None
+
+            out_file = os.path.join(OutputDir, f'point{p}', f'{m}.sdf')
+            os.makedirs(os.path.dirname(out_file), exist_ok=True)
+
+            row = dict({**points[p], 'Point': p, 'Molecule': molecules[m][0], 'Record': molecules[m][1], 'OutputFile': out_file,
+                        'Runtime': None, 'Energy': None, 'EnergyUnit': None, 'ExitCode': None, 'Error': None})
+
+            # A failing run is recorded in the table instead of aborting the whole sweep
+            try:
+                run_start = time.perf_counter()
+                func_return = getattr(self, Method)(OB_InputFile=prepared[m], OB_OutputFile=out_file, **{**Params, **points[p]}, Execute=True)
+                row['Runtime'] = time.perf_counter() - run_start
+                row['ExitCode'] = func_return['CmdRtrn']['ExitCode']
+                row['Energy'], row['EnergyUnit'] = self.__ReadEnergy(FilePath=out_file, ForceField=EnergyForceField)
+            except Exception as err:
+                row['Error'] = str(err)
+
+            with lock:
+                if bool(row['Error'] != None) or bool(row['ExitCode'] != 0):
+                    failures[p] += 1
+                    return row
+
+                results[p][m] = (row['Runtime'], row['Energy'])
+                if  bool(EarlyStop) \
+                and not bool(stopped[p]) \
+                and bool(dominated(p)):
+                    stopped[p] = True
+                    if bool(Verbose):
+                        self.UsrOut(DisplayText=f'Stopping point {p} {points[p]}, dominated by cost', Status='NTE')
+
+            return row
+
+        # Molecule-major order, so all points are compared on the same molecules as early as possible
+        jobs = [(p, m) for m in range(len(prepared)) for p in range(len(points))]
+        with ThreadPoolExecutor(max_workers=Workers or os.cpu_count()) as executor:
+            table = [row for row in executor.map(run, jobs) if bool(row)]
+
+        # Common set: molecules with an energy for every point that completed at least one molecule,
+        # so 'Common' means of different points are computed over the same molecules and can be compared
+        reported = [p for p in range(len(points)) if bool(results[p])]
+        common = [m for m in range(len(prepared)) if bool(reported) and bool(all(bool(m in results[p]) and bool(results[p][m][1] != None) for p in reported))]
+
+        summary = []
+        for p, point in enumerate(points):
+            runtimes = [x[0] for x in results[p].values()]
+            energies = [x[1] for x in results[p].values() if bool(x[1] != None)]
+            in_common = bool(p in reported) and bool(common)
+            summary.append(dict({
+                **point,
+                'Point'                 : p,
+                'Completed'             : len(runtimes),
+                'Failed'                : failures[p],
+                'TotalRuntime'          : sum(runtimes),
+                'MeanRuntime'           : sum(runtimes) / len(runtimes) if bool(runtimes) else None,
+                'MeanEnergy'            : sum(energies) / len(energies) if bool(energies) else None,
+                'CommonMolecules'       : len(common) if bool(in_common) else 0,
+                'CommonMeanRuntime'     : sum(results[p][m][0] for m in common) / len(common) if bool(in_common) else None,
+                'CommonMeanEnergy'      : sum(results[p][m][1] for m in common) / len(common) if bool(in_common) else None,
+                'Stopped'               : stopped[p],
+            }))
+
+        if bool(TableFile):
+            with open(file=TableFile, mode='w', newline='') as out_file:
+                writer = csv.DictWriter(out_file, fieldnames=['Point', *grid_keys, 'Molecule', 'Record', 'OutputFile', 'Runtime', 'Energy', 'EnergyUnit', 'ExitCode', 'Error'])
+                writer.writeheader()
+                writer.writerows(table)
+
+        elapsed = time.perf_counter() - start_time
+        if bool(Verbose):
+            self.UsrOut(DisplayText=f'Swept {len(points)} point(s) over {len(prepared)} molecule(s) in {elapsed:.2f}s, {sum(stopped)} stopped early', Status='SCS')
+
+        return dict({
+            'Table'     : table,
+            'Summary'   : summary,
+            'Elapsed'   : elapsed,
+        })
+
+    def __ReadEnergy(self, FilePath: str, ForceField: str) -> tuple:
+        """
+            ### Evaluate the total energy of a molecule file with obenergy, summed over all molecules of the file
+
+            #### Args:
+                - FilePath (str): Molecule file path.
+                - ForceField (str): Force field used for evaluation.
+
+            #### Returns:
+                - tuple: (energy, unit), both None if the energy could not be evaluated.
+        """
+
+        if not bool(os.path.isfile(FilePath)) or not bool(os.path.getsize(FilePath) > 0):
+            return None, None
+
+        energy_file = FilePath + '.energy'
+        self.Obenergy(OB_InputFile=FilePath, OB_OutputFile=energy_file, OB_ForceField=ForceField, Execute=True)
+
+        if not bool(os.path.isfile(energy_file)):
+            return None, None
+        with open(file=energy_file, mode='r') as in_file:
+            energies = re.findall(r'TOTAL ENERGY\s*=\s*([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\s*(\S+)', in_file.read())
+
+        # One energy is reported per molecule
+        return (sum(float(x[0]) for x in energies), energies[0][1]) if bool(energies) else (None, None)
+
+    def ReadCoordinates(self,
+        InputFiles:     str | list | tuple,
+        InputFormat:    str | None  = None,
+        Verbose:        bool        = False
+    ) -> dict:
+        """
+            ### Bulk-load atomic coordinates and elements from output files into contiguous NumPy arrays.
+            Intended for the outputs of `Obabel(OB_Generate3D=True)`, `Obminimize`, `Obconformer` and `Obgen`.
+            Files are memory-mapped and the fixed-width atom blocks are sliced out with vectorized NumPy indexing.
+
+            #### Args:
+                - InputFiles (str | list | tuple): One or more molecule file paths (multi-molecule files are supported).
+                - InputFormat (str | None, optional): 'sdf', 'mol' or 'xyz'. If set to None, then will be detected from file extension. Defaults to None.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - dict: The dict includes ['Coords', 'Elements', 'Offsets', 'Titles']. 'Coords' is a float64 array of shape (N, 3), \
+                    'Elements' is a str array of shape (N,), 'Offsets' is an int64 array of shape (M + 1,) where atoms of \
+                    molecule i are `Coords[Offsets[i]:Offsets[i + 1]]`, and 'Titles' is a list of M molecule titles.
+        """
+
+        # NumPy is only required by this method, so it is imported here
+        try:
+            import numpy as np
+        except ImportError as err:
+            raise ImportError('"ReadCoordinates" requires NumPy. Install it using "pip install numpy".') from err
+
+        InputFiles = [InputFiles] if isinstance(InputFiles, str) else list(InputFiles)
+
+        # Carriers for per-file results
+        coords, elements, counts, titles = [], [], [], []
+
+        for in_file in InputFiles:
+            in_format = (InputFormat or in_file.split('.')[-1]).lower()
+
+            if bool(in_format in ('sdf', 'sd', 'mol', 'mdl')):
+                file_data = self.__ParseSDF(in_file, np)
+            elif bool(in_format == 'xyz'):
+                file_data = self.__ParseXYZ(in_file, np)
+            else:
+                raise ValueError(f'Unsupported format "{in_format}" for "{in_file}"! Supported formats are sdf, mol and xyz.')
+
+            coords.append(file_data['Coords'])
+            elements.append(file_data['Elements'])
+            counts.append(file_data['Counts'])
+            titles.extend(file_data['Titles'])
+
+            if bool(Verbose):
+                self.UsrOut(DisplayText=f'Loaded {len(file_data["Counts"])} molecule(s), {len(file_data["Elements"])} atom(s) from "{in_file}"', Status='SCS')
+
+        counts = np.concatenate(counts) if bool(counts) else np.zeros(0, dtype=np.int64)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return dict({
+            'Coords'    : np.concatenate(coords) if bool(coords) else np.zeros((0, 3), dtype=np.float64),
+            'Elements'  : np.concatenate(elements) if bool(elements) else np.zeros(0, dtype=str),
+            'Offsets'   : offsets,
+            'Titles'    : titles,
+        })
+
+    # Bytes (or index cells) processed per NumPy pass by the coordinates reader, bounds its peak memory
+    __ChunkSize = 1 << 22
+
+    def __MapLines(self, FilePath: str, np) -> tuple:
+        """
+            ### Memory-map a text file and locate the start of every line
+
+            #### Args:
+                - FilePath (str): File path.
+                - np (module): NumPy module.
+
+            #### Returns:
+                - tuple: (buffer as uint8 array, line start offsets, line end offsets excluding line breaks).
+        """
+
+        # Empty files cannot be memory-mapped
+        if bool(os.path.getsize(FilePath) == 0):
+            empty = np.zeros(0, dtype=np.int64)
+            return np.zeros(0, dtype=np.uint8), empty, empty
+
+        buffer = np.memmap(FilePath, dtype=np.uint8, mode='r')
+        offset_type = self.__OffsetType(buffer, np)
+        # Line breaks are searched chunk by chunk to avoid a file-sized mask
+        breaks = np.concatenate([np.zeros(0, dtype=offset_type)] + [
+            (np.flatnonzero(buffer[x:x + self.__ChunkSize] == ord('\n')) + x).astype(offset_type)
+            for x in range(0, buffer.size, self.__ChunkSize)
+        ])
+
+        # A last line without a trailing line break is still a line
+        if bool(breaks.size == 0) or bool(breaks[-1] != buffer.size - 1):
+            breaks = np.append(breaks, np.array([buffer.size], dtype=offset_type))
+
+        starts = np.concatenate((np.zeros(1, dtype=offset_type), breaks[:-1] + 1))
+        # Exclude '\r' of CRLF line breaks from line ends
+        ends = breaks - (buffer[np.maximum(breaks - 1, 0)] == ord('\r'))
+        return buffer, starts, ends
+
+    def __OffsetType(self, Buffer, np):
+        """
+            ### Smallest integer type able to hold byte offsets of a buffer, halves offset arrays of files under 2 GB
+        """
+
+        return np.int32 if bool(Buffer.size < np.iinfo(np.int32).max) else np.int64
+
+    def __TokenBounds(self, Buffer, np) -> tuple:
+        """
+            ### Locate every whitespace separated token of a buffer
+
+            #### Returns:
+                - tuple: (token start offsets, token end offsets).
+        """
+
+        offset_type = self.__OffsetType(Buffer, np)
+        starts, ends = [np.zeros(0, dtype=offset_type)], [np.zeros(0, dtype=offset_type)]
+        previous_blank = True
+        for x in range(0, Buffer.size, self.__ChunkSize):
+            # Space, tab, CR and LF are all <= 32
+            blank = Buffer[x:x + self.__ChunkSize] <= ord(' ')
+            before = np.concatenate(([previous_blank], blank[:-1]))
+            starts.append((np.flatnonzero(~blank & before) + x).astype(offset_type))
+            ends.append((np.flatnonzero(blank & ~before) + x).astype(offset_type))
+            previous_blank = bool(blank[-1])
+
+        # A token running to the end of the buffer
+        if not bool(previous_blank):
+            ends.append(np.array([Buffer.size], dtype=offset_type))
+
+        return np.concatenate(starts), np.concatenate(ends)
+
+    def __RangeIndex(self, Firsts, Counts, np):
+        """
+            ### Concatenate ranges [Firsts[i], Firsts[i] + Counts[i]) into one index array without a Python loop
+        """
+
+        local_index = np.arange(Counts.sum(), dtype=np.int64) - np.repeat(np.cumsum(Counts) - Counts, Counts)
+        return np.repeat(Firsts, Counts) + local_index
+
+    def __SliceColumns(self, Buffer, Starts, Ends, First: int, Last: int, np):
+        """
+            ### Slice fixed-width columns [First, Last) out of many lines at once
+
+            #### Returns:
+                - ndarray: Bytes array of shape (len(Starts),) with dtype S(Last - First), padded with spaces past line ends.
+        """
+
+        width = Last - First
+        columns = np.arange(First, Last)
+        sliced = np.empty(len(Starts), dtype=f'S{width}')
+
+        # Lines are sliced in chunks so the (lines x width) index never exceeds '__ChunkSize' cells
+        rows = max(1, self.__ChunkSize // width)
+        for x in range(0, len(Starts), rows):
+            index = Starts[x:x + rows, None] + columns[None, :]
+            # Anything beyond the end of a line is treated as blank
+            inside = index < Ends[x:x + rows, None]
+            block = np.where(inside, Buffer[np.minimum(index, Buffer.size - 1)], ord(' ')).astype(np.uint8)
+            sliced[x:x + rows] = block.view(f'S{width}').ravel()
+
+        return sliced
+
+    def __ParseSDF(self, FilePath: str, np) -> dict:
+        """
+            ### Parse V2000 SDF/MOL atom blocks of a (multi-molecule) file
+
+            #### Returns:
+                - dict: The dict includes ['Coords', 'Elements', 'Counts', 'Titles'].
+        """
+
+        buffer, starts, ends = self.__MapLines(FilePath, np)
+
+        # Records are terminated by '$$$$', a single MOL file may not have one. Only lines starting with '$' are sliced.
+        candidates = np.flatnonzero((ends - starts >= 4) & (buffer[np.minimum(starts, max(buffer.size - 1, 0))] == ord('$')))
+        terminators = candidates[self.__SliceColumns(buffer, starts[candidates], ends[candidates], 0, 4, np) == b'$$$$']
+        record_starts = np.concatenate(([0], terminators + 1)).astype(np.int64)
+        record_starts = record_starts[record_starts + 3 < starts.size]
+
+        # Counts line (4th line of each record): first 3 columns are the number of atoms
+        counts_lines = record_starts + 3
+        counts = np.char.strip(self.__SliceColumns(buffer, starts[counts_lines], ends[counts_lines], 0, 3, np))
+
+        # Drop trailing blank lines after the last terminator
+        if bool(counts.size) and bool(counts[-1] == b''):
+            record_starts, counts_lines, counts = record_starts[:-1], counts_lines[:-1], counts[:-1]
+
+        version = self.__SliceColumns(buffer, starts[counts_lines], ends[counts_lines], 34, 39, np)
+        if bool(np.any(version == b'V3000')):
+            raise ValueError(f'V3000 records in "{FilePath}" are not supported! Only V2000 atom blocks can be read.')
+        counts = counts.astype(np.int64)
+
+        # Atom lines of each record start right after the counts line
+        atom_lines = self.__RangeIndex(record_starts + 4, counts, np)
+        atom_starts, atom_ends = starts[atom_lines], ends[atom_lines]
+        del atom_lines
+
+        # Atom line layout: xxxxx.xxxxyyyyy.yyyyzzzzz.zzzz aaa
+        xyz = self.__SliceColumns(buffer, atom_starts, atom_ends, 0, 30, np).view('S10').reshape(-1, 3).astype(np.float64)
+        symbols = np.char.strip(self.__SliceColumns(buffer, atom_starts, atom_ends, 31, 34, np)).astype(str)
+
+        # Titles are the first line of each record
+        titles = [bytes(buffer[starts[i]:ends[i]]).decode('UTF-8', 'replace').strip() for i in record_starts]
+
+        return dict({
+            'Coords'    : xyz,
+            'Elements'  : symbols,
+            'Counts'    : counts,
+            'Titles'    : titles,
+        })
+
+    def __ParseXYZ(self, FilePath: str, np) -> dict:
+        """
+            ### Parse XYZ atom blocks of a (multi-molecule) file
+
+            #### Returns:
+                - dict: The dict includes ['Coords', 'Elements', 'Counts', 'Titles'].
+        """
+
+        buffer, starts, ends = self.__MapLines(FilePath, np)
+
+        # XYZ records are chained: [count line, title line, atom lines...]. Only record headers are walked in Python.
+        record_starts, counts = [], []
+        line = 0
+        while bool(line < starts.size):
+            head = bytes(buffer[starts[line]:ends[line]]).strip()
+            if not bool(head):
+                line += 1
+                continue
+            record_starts.append(line)
+            counts.append(int(head))
+            line += int(head) + 2
+
+        record_starts = np.asarray(record_starts, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if bool(np.any(record_starts + 1 + counts >= starts.size)):
+            raise ValueError(f'Truncated record in "{FilePath}"! Fewer atom lines than declared.')
+
+        # Atom lines are free-format, so tokens of each atom block are located by byte range.
+        # Every atom block must hold exactly 4 tokens per atom: '<element> <x> <y> <z>'.
+        token_starts, token_ends = self.__TokenBounds(buffer, np)
+        block_starts = starts[record_starts + 2]
+        block_ends = np.where(counts > 0, ends[np.minimum(record_starts + 1 + counts, starts.size - 1)], block_starts)
+        first_token = np.searchsorted(token_starts, block_starts, side='left')
+        last_token = np.searchsorted(token_starts, block_ends, side='left')
+        if bool(np.any(last_token - first_token != 4 * counts)):
+            raise ValueError(f'Unexpected atom line layout in "{FilePath}"! Expected "<element> <x> <y> <z>" on each atom line.')
+
+        tokens = self.__RangeIndex(first_token, 4 * counts, np).reshape(-1, 4)
+        element_tokens, coord_tokens = tokens[:, 0], tokens[:, 1:].ravel()
+        del tokens
+
+        # Tokens are sliced as fixed-width fields as wide as the longest token
+        width = lambda index: int((token_ends[index] - token_starts[index]).max()) if bool(index.size) else 1
+        element_width, coord_width = width(element_tokens), width(coord_tokens)
+        elements = self.__SliceColumns(buffer, token_starts[element_tokens], token_ends[element_tokens], 0, element_width, np)
+        coords = self.__SliceColumns(buffer, token_starts[coord_tokens], token_ends[coord_tokens], 0, coord_width, np)
+
+        titles = [bytes(buffer[starts[i + 1]:ends[i + 1]]).decode('UTF-8', 'replace').strip() for i in record_starts]
+
+        return dict({
+            'Coords'    : coords.astype(np.float64).reshape(-1, 3),
+            'Elements'  : np.char.strip(elements).astype(str),
+            'Counts'    : counts,
+            'Titles'    : titles,
+        })